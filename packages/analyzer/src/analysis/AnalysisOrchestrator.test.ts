@@ -317,4 +317,26 @@ describe('AnalysisOrchestrator', () => {
       // Should not throw errors
     });
   });
+
+  describe('default options', () => {
+    afterEach(() => {
+      vi.doUnmock('os');
+      vi.resetModules();
+    });
+
+    it.each([2, 32])('should size the worker pool for %i CPUs', async (cpuCount) => {
+      vi.resetModules();
+      vi.doMock('os', async (importOriginal) => ({
+        ...(await importOriginal<typeof import('os')>()),
+        cpus: () => new Array(cpuCount).fill({}),
+      }));
+
+      const { DEFAULT_ANALYSIS_OPTIONS, DEFAULT_WORKER_POOL_OPTIONS } =
+        await import('./AnalysisOrchestrator');
+
+      expect(DEFAULT_WORKER_POOL_OPTIONS.minThreads).toBe(Math.min(4, cpuCount));
+      expect(DEFAULT_WORKER_POOL_OPTIONS.maxThreads).toBe(cpuCount);
+      expect(DEFAULT_ANALYSIS_OPTIONS.maxWorkers).toBe(cpuCount);
+    });
+  });
 });
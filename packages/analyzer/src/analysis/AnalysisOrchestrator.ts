@@ -1,5 +1,6 @@
 import { fileURLToPath } from 'url';
 import { dirname, resolve } from 'path';
+import { cpus } from 'os';
 import Piscina from 'piscina';
 import { LRUCache } from 'lru-cache';
 import { createHash } from 'crypto';
@@ -20,6 +21,29 @@ import type {
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 
+// Analysis is CPU-bound, so size the pool to the machine rather than a fixed count
+const CPU_COUNT = Math.max(1, cpus().length);
+
+export const DEFAULT_WORKER_POOL_OPTIONS: WorkerPoolOptions = {
+  minThreads: Math.min(4, CPU_COUNT),
+  maxThreads: CPU_COUNT,
+  idleTimeout: 60000,
+  maxQueue: 1000,
+  resourceLimits: {
+    maxOldGenerationSizeMb: 512,
+    maxYoungGenerationSizeMb: 128,
+  },
+};
+
+export const DEFAULT_ANALYSIS_OPTIONS: AnalysisOptions = {
+  batchSize: 50,
+  cacheTTL: 1000 * 60 * 60, // 1 hour
+  confidenceThreshold: 0.5,
+  enableCrossAnalysis: true,
+  enableEmbeddings: true,
+  maxWorkers: CPU_COUNT,
+};
+
 export class AnalysisOrchestrator {
   private workerPool: Piscina;
   private resultCache: LRUCache<string, AnalysisResult>;
@@ -30,24 +54,8 @@ export class AnalysisOrchestrator {
   private activeTasks: Set<string> = new Set();
 
   constructor(
-    options: WorkerPoolOptions = {
-      minThreads: 8,
-      maxThreads: 16,
-      idleTimeout: 60000,
-      maxQueue: 1000,
-      resourceLimits: {
-        maxOldGenerationSizeMb: 512,
-        maxYoungGenerationSizeMb: 128,
-      },
-    },
-    private analysisOptions: AnalysisOptions = {
-      batchSize: 50,
-      cacheTTL: 1000 * 60 * 60, // 1 hour
-      confidenceThreshold: 0.5,
-      enableCrossAnalysis: true,
-      enableEmbeddings: true,
-      maxWorkers: 16,
-    }
+    options: WorkerPoolOptions = DEFAULT_WORKER_POOL_OPTIONS,
+    private analysisOptions: AnalysisOptions = DEFAULT_ANALYSIS_OPTIONS
   ) {
     // Initialize worker pool with CPU-optimized settings
     // Determine worker path - in dist/, workers are at ./workers/, in src/ at ../workers/
@@ -17,6 +17,26 @@ export class ContentMetricsAnalyzer implements Analyzer {
   private readabilityScorer: ReadabilityScorer;
   private sentimentAnalyzer: SentimentAnalyzer;
 
+  // Static word lists to avoid rebuilding them for every word or sentence
+  private static readonly STOP_WORDS = new Set([
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these',
+    'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him',
+    'her', 'us', 'them', 'my', 'your', 'his', 'its', 'our', 'their'
+  ]);
+
+  private static readonly POSITIVE_WORDS = new Set([
+    'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'love', 'like',
+    'best', 'awesome', 'brilliant', 'perfect'
+  ]);
+
+  private static readonly NEGATIVE_WORDS = new Set([
+    'bad', 'terrible', 'awful', 'horrible', 'hate', 'worst', 'disappointing', 'poor',
+    'ugly', 'stupid', 'wrong', 'fail'
+  ]);
+
   constructor() {
     this.readabilityScorer = new ReadabilityScorer();
     this.sentimentAnalyzer = new SentimentAnalyzer();
@@ -210,18 +230,15 @@ export class ContentMetricsAnalyzer implements Analyzer {
   }
 
   private analyzeSentenceSentiment(sentence: string): { score: number; magnitude: number } {
-    const positiveWords = ['good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'love', 'like', 'best', 'awesome', 'brilliant', 'perfect'];
-    const negativeWords = ['bad', 'terrible', 'awful', 'horrible', 'hate', 'worst', 'disappointing', 'poor', 'ugly', 'stupid', 'wrong', 'fail'];
-
     const words = sentence.toLowerCase().split(/\s+/);
     let positiveScore = 0;
     let negativeScore = 0;
 
     for (const word of words) {
-      if (positiveWords.includes(word)) {
+      if (ContentMetricsAnalyzer.POSITIVE_WORDS.has(word)) {
         positiveScore++;
       }
-      if (negativeWords.includes(word)) {
+      if (ContentMetricsAnalyzer.NEGATIVE_WORDS.has(word)) {
         negativeScore++;
       }
     }
@@ -266,16 +283,7 @@ export class ContentMetricsAnalyzer implements Analyzer {
   }
 
   private isStopWord(word: string): boolean {
-    const stopWords = new Set([
-      'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-      'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-      'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-      'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these',
-      'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him',
-      'her', 'us', 'them', 'my', 'your', 'his', 'its', 'our', 'their'
-    ]);
-
-    return stopWords.has(word.toLowerCase());
+    return ContentMetricsAnalyzer.STOP_WORDS.has(word.toLowerCase());
   }
 
   private async analyzeStructure(markdown: string): Promise<StructureMetrics> {
@@ -681,23 +689,23 @@ class ReadabilityScorer {
 }
 
 class SentimentAnalyzer {
-  private positiveWords = [
+  private positiveWords = new Set([
     'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'love', 'like',
     'best', 'awesome', 'brilliant', 'perfect', 'beautiful', 'outstanding', 'superb',
     'magnificent', 'incredible', 'extraordinary', 'marvelous', 'splendid', 'fabulous',
     'delightful', 'pleasant', 'joyful', 'happy', 'pleased', 'satisfied', 'grateful',
     'thankful', 'blessed', 'fortunate', 'lucky', 'proud', 'honored', 'respected',
     'admired', 'appreciated', 'valued', 'cherished', 'treasured', 'precious', 'special'
-  ];
+  ]);
 
-  private negativeWords = [
+  private negativeWords = new Set([
     'bad', 'terrible', 'awful', 'horrible', 'hate', 'worst', 'disappointing', 'poor',
     'ugly', 'stupid', 'wrong', 'fail', 'failure', 'pathetic', 'useless', 'worthless',
     'disgusting', 'revolting', 'repulsive', 'offensive', 'annoying', 'irritating',
     'frustrating', 'infuriating', 'maddening', 'exasperating', 'aggravating', 'vexing',
     'troublesome', 'problematic', 'difficult', 'challenging', 'stressful', 'worrying',
     'concerning', 'alarming', 'frightening', 'scary', 'terrifying', 'horrific', 'dreadful'
-  ];
+  ]);
 
   analyze(text: string): SentimentAnalysis {
     const sentences = text.split(/[.!?]+/).filter(s => s.trim().length > 0);
@@ -756,10 +764,10 @@ class SentimentAnalyzer {
     let negativeScore = 0;
 
     for (const word of words) {
-      if (this.positiveWords.includes(word)) {
+      if (this.positiveWords.has(word)) {
         positiveScore++;
       }
-      if (this.negativeWords.includes(word)) {
+      if (this.negativeWords.has(word)) {
         negativeScore++;
       }
     }
@@ -13,6 +13,11 @@ export class PageTypeClassifier implements Analyzer {
   private patterns!: Map<PageType, Pattern[]>;
   private typeIndex!: Map<string, number>;
 
+  // Static regex patterns to avoid recompilation on every call
+  private static readonly HEADING_LEVEL_PATTERNS = [1, 2, 3, 4, 5, 6].map(
+    level => new RegExp(`^#{${level}}\\s`, 'gm')
+  );
+
   constructor() {
     this.initializePatterns();
     this.initializeTypeIndex();
@@ -260,8 +265,8 @@ export class PageTypeClassifier implements Analyzer {
     features.push(avgLevel / 6); // Normalize to 0-1
 
     // Heading distribution
-    for (let i = 1; i <= 6; i++) {
-      const count = (markdown.match(new RegExp(`^#{${i}}\\s`, 'gm')) || []).length;
+    for (const pattern of PageTypeClassifier.HEADING_LEVEL_PATTERNS) {
+      const count = (markdown.match(pattern) || []).length;
       features.push(count / 20); // Normalize
     }
 
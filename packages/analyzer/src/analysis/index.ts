@@ -1,5 +1,9 @@
 // Analysis module exports
-export { AnalysisOrchestrator } from './AnalysisOrchestrator.js';
+export {
+  AnalysisOrchestrator,
+  DEFAULT_ANALYSIS_OPTIONS,
+  DEFAULT_WORKER_POOL_OPTIONS,
+} from './AnalysisOrchestrator.js';
 export { PageTypeClassifier } from './PageTypeClassifier.js';
 export { SectionDetector } from './SectionDetector.js';
 export { ContentMetricsAnalyzer } from './ContentMetricsAnalyzer.js';
@@ -3,7 +3,14 @@
  */
 
 // Export main analysis orchestrator
-export { AnalysisOrchestrator } from "./analysis/AnalysisOrchestrator.js";
+export {
+  AnalysisOrchestrator,
+  DEFAULT_ANALYSIS_OPTIONS,
+  DEFAULT_WORKER_POOL_OPTIONS,
+} from "./analysis/AnalysisOrchestrator.js";
+
+// Export package version, e.g. for keying persisted results
+export { ANALYZER_VERSION } from "./version.js";
 
 // Export individual analyzers
 export { ContentMetricsAnalyzer } from "./analysis/ContentMetricsAnalyzer.js";
@@ -0,0 +1,18 @@
+import { readFileSync } from 'fs';
+import { dirname, join } from 'path';
+import { fileURLToPath } from 'url';
+
+function readPackageVersion(): string {
+  // Both src/ and the bundled dist/ sit one level below package.json
+  try {
+    const pkgPath = join(dirname(fileURLToPath(import.meta.url)), '../package.json');
+    return JSON.parse(readFileSync(pkgPath, 'utf8')).version;
+  } catch {
+    return '0.0.0';
+  }
+}
+
+/**
+ * Version of the analyzer package, read from its package.json
+ */
+export const ANALYZER_VERSION: string = readPackageVersion();
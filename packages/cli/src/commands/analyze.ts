@@ -1,15 +1,24 @@
 import { Command } from "commander";
-import { AnalysisOrchestrator } from "@site-generator/analyzer";
+import {
+  AnalysisOrchestrator,
+  DEFAULT_ANALYSIS_OPTIONS,
+} from "@site-generator/analyzer";
 import {
   readExtractedFiles,
   directoryExists,
   writeAnalysisResults,
   writeSummary,
+  getAnalysisCacheDir,
+  mapWithConcurrency,
+  prepareAnalysisFile,
+  analyzePendingFiles,
+  cacheAnalysisResults,
   ProgressDisplay,
   formatSuccess,
   formatError,
   formatWarning,
 } from "../utils/index.js";
+import type { AnalysisFailure, PreparedFile } from "../utils/index.js";
 
 interface AnalyzeCommandOptions {
   input: string;
@@ -18,9 +27,23 @@ interface AnalyzeCommandOptions {
   classification: boolean;
   sections: boolean;
   all: boolean;
+  concurrency: number;
+  force: boolean;
   verbose: boolean;
 }
 
+interface AnalysisTypes {
+  metrics: boolean;
+  classification: boolean;
+  sections: boolean;
+}
+
+interface AnalyzedFile {
+  filename: string;
+  domain: string;
+  result: any;
+}
+
 export function createAnalyzeCommand(): Command {
   const command = new Command("analyze");
 
@@ -43,6 +66,12 @@ export function createAnalyzeCommand(): Command {
     .option("--classification", "Run page type classification", false)
     .option("--sections", "Run section detection analysis", false)
     .option("--all", "Run all analysis types", false)
+    .option(
+      "--concurrency <n>",
+      "Number of files analyzed in parallel",
+      String(DEFAULT_ANALYSIS_OPTIONS.maxWorkers),
+    )
+    .option("--force", "Ignore cached results and re-analyze all files", false)
     .option("--verbose", "Show detailed logs", false)
     .action(async (options: AnalyzeCommandOptions) => {
       await handleAnalyze(options);
@@ -60,7 +89,7 @@ async function handleAnalyze(options: AnalyzeCommandOptions): Promise<void> {
     const runAll =
       options.all ||
       (!options.metrics && !options.classification && !options.sections);
-    const analysisTypes = {
+    const analysisTypes: AnalysisTypes = {
       metrics: runAll || options.metrics,
       classification: runAll || options.classification,
       sections: runAll || options.sections,
@@ -101,119 +130,82 @@ async function handleAnalyze(options: AnalyzeCommandOptions): Promise<void> {
       `Found ${files.length} file${files.length > 1 ? "s" : ""} to analyze`,
     );
 
-    // Initialize orchestrator
-    orchestrator = new AnalysisOrchestrator();
-
-    // Analyze each file
-    const allResults: any[] = [];
+    // Initialize orchestrator; concurrency bounds its in-flight pages
+    const concurrency = Math.max(
+      1,
+      parseInt(options.concurrency.toString()) || 1,
+    );
+    // Pages are analyzed independently, as they were one file at a time;
+    // cross-page linking over a large batch is quadratic
+    orchestrator = new AnalysisOrchestrator(undefined, {
+      ...DEFAULT_ANALYSIS_OPTIONS,
+      maxWorkers: concurrency,
+      enableCrossAnalysis: false,
+    });
+    const cacheDir = getAnalysisCacheDir(options.output);
     const startTime = Date.now();
 
-    for (const file of files) {
-      const fileStartTime = Date.now();
-      progress.start(`Analyzing ${file.filename}...`);
+    // Reuse results from a previous run when the page is unchanged
+    const prepared = await mapWithConcurrency(files, concurrency, (file) =>
+      prepareAnalysisFile(file, cacheDir, options.force),
+    );
+    const pending = prepared.filter((item) => item.result === undefined);
+    const cachedCount = prepared.length - pending.length;
+    const failures: AnalysisFailure[] = [];
 
-      // Parse content based on format
-      let contentToAnalyze = file.content;
-      let extractedTitle = file.filename;
-      let extractedUrl = file.path;
+    if (pending.length > 0) {
+      progress.start(
+        `Analyzing ${pending.length} file${pending.length > 1 ? "s" : ""} (concurrency: ${concurrency})...`,
+      );
+      const analysisFailures = await analyzePendingFiles(
+        orchestrator,
+        pending,
+        concurrency,
+        options.verbose,
+      );
+      failures.push(...analysisFailures);
+    }
 
-      if (file.format === "json") {
+    // Write per-file results
+    const completed = prepared.filter((item) => item.result !== undefined);
+    const written = await mapWithConcurrency(
+      completed,
+      concurrency,
+      async (item) => {
         try {
-          const parsed = JSON.parse(file.content);
-          // Handle different JSON structures
-          if (parsed.content) {
-            contentToAnalyze =
-              parsed.content.markdown ||
-              parsed.content.html ||
-              parsed.content.text ||
-              "";
-            extractedTitle =
-              parsed.content.metadata?.title ||
-              parsed.content.title ||
-              file.filename;
-            extractedUrl = parsed.content.url || file.path;
-          } else {
-            contentToAnalyze =
-              parsed.markdown ||
-              parsed.html ||
-              parsed.text ||
-              JSON.stringify(parsed);
-          }
-        } catch {
-          console.log(
-            formatWarning(
-              `Could not parse JSON in ${file.filename}, using raw content`,
-            ),
-          );
-        }
-      }
-
-      // Run analysis
-      try {
-        const analysisResults = await orchestrator.analyzeContent([
-          {
-            url: extractedUrl,
-            title: extractedTitle,
-            markdown: contentToAnalyze || "",
-            frontmatter: {},
-            metadata: {
-              format: file.format,
-              timestamp: file.timestamp,
-            },
-          },
-        ]);
-
-        const analysisResult = analysisResults[0];
-
-        if (!analysisResult) {
-          progress.fail(`Analysis returned no results for ${file.filename}`);
-          continue;
-        }
-
-        const fileDuration = ((Date.now() - fileStartTime) / 1000).toFixed(1);
-        progress.succeed(`Analysis complete (${fileDuration}s)`);
-
-        // Write results
-        if (options.verbose) {
-          progress.start("Writing analysis files...");
-        }
-
-        const writtenFiles = await writeAnalysisResults({
-          outputDir: options.output,
-          domain: file.domain,
-          timestamp: file.timestamp,
-          results: {
-            full: analysisResult,
-            metrics: analysisTypes.metrics
-              ? (analysisResult as any).contentMetrics || analysisResult.metrics
-              : undefined,
-            classification: analysisTypes.classification
-              ? (analysisResult as any).classification || {
-                  pageType: (analysisResult as any).pageType,
-                  confidence: (analysisResult as any).confidence,
-                }
-              : undefined,
-            sections: analysisTypes.sections
-              ? analysisResult.sections
-              : undefined,
-          },
-        });
-
-        if (options.verbose) {
-          progress.succeed(`Wrote ${writtenFiles.length} file(s)`);
+          await writeFileResults(item, analysisTypes, options.output);
+          return true;
+        } catch (writeError) {
+          failures.push({ filename: item.file.filename, error: writeError });
+          return false;
         }
+      },
+    );
+    const analyzed = completed.filter((_, index) => written[index]);
+
+    // Cache fresh results last so a cache problem never delays the output
+    await cacheAnalysisResults(pending, cacheDir, concurrency, options.verbose);
+
+    const analysisDuration = ((Date.now() - startTime) / 1000).toFixed(1);
+    const allResults: AnalyzedFile[] = analyzed.map((item) => ({
+      filename: item.file.filename,
+      domain: item.file.domain,
+      result: item.result,
+    }));
+
+    if (allResults.length > 0) {
+      progress.succeed(
+        `Analyzed ${allResults.length}/${files.length} files (${analysisDuration}s` +
+          (cachedCount > 0 ? `, ${cachedCount} from cache)` : ")"),
+      );
+    } else {
+      progress.fail("Analysis failed for all files");
+    }
 
-        allResults.push({
-          filename: file.filename,
-          domain: file.domain,
-          result: analysisResult,
-        });
-      } catch (analyzeError) {
-        progress.fail(`Analysis failed for ${file.filename}`);
-        if (options.verbose) {
-          console.error(analyzeError);
-        }
-        continue;
+    for (const failure of failures) {
+      console.log(formatWarning(`Analysis failed for ${failure.filename}`));
+      if (options.verbose) {
+        console.error(failure.error);
       }
     }
 
@@ -270,6 +262,33 @@ async function handleAnalyze(options: AnalyzeCommandOptions): Promise<void> {
   }
 }
 
+async function writeFileResults(
+  item: PreparedFile,
+  analysisTypes: AnalysisTypes,
+  outputDir: string,
+): Promise<void> {
+  const { file, result: analysisResult } = item;
+
+  await writeAnalysisResults({
+    outputDir,
+    domain: file.domain,
+    timestamp: file.timestamp,
+    results: {
+      full: analysisResult,
+      metrics: analysisTypes.metrics
+        ? analysisResult.contentMetrics || analysisResult.metrics
+        : undefined,
+      classification: analysisTypes.classification
+        ? analysisResult.classification || {
+            pageType: analysisResult.pageType,
+            confidence: analysisResult.confidence,
+          }
+        : undefined,
+      sections: analysisTypes.sections ? analysisResult.sections : undefined,
+    },
+  });
+}
+
 function generateSummary(results: any[]): any {
   const summary = {
     totalFiles: results.length,
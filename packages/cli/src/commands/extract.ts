@@ -328,9 +328,9 @@ async function handleCrawl(options: ExtractCommandOptions): Promise<void> {
     console.log(formatSuccess(`Files saved to: ${options.output}\n`));
 
     // Clean up state file on successful completion
-    if (existsSync(stateFile)) {
-      await unlink(stateFile);
-    }
+    await unlink(stateFile).catch((error: NodeJS.ErrnoException) => {
+      if (error.code !== "ENOENT") throw error;
+    });
   } catch (error) {
     if (updateInterval) clearInterval(updateInterval);
     console.error(
@@ -1,6 +1,5 @@
 import { readFile, writeFile, mkdir } from "fs/promises";
 import { join, dirname } from "path";
-import { existsSync } from "fs";
 import { homedir } from "os";
 
 export interface SiteGeneratorConfig {
@@ -46,21 +45,19 @@ export class ConfigManager {
 
   async load(): Promise<SiteGeneratorConfig> {
     try {
-      if (existsSync(this.configPath)) {
-        const content = await readFile(this.configPath, "utf-8");
-        const loaded = JSON.parse(content);
-        this.config = {
-          ...DEFAULT_CONFIG,
-          ...loaded,
-          crawler: { ...DEFAULT_CONFIG.crawler, ...(loaded.crawler || {}) },
-          extractor: {
-            ...DEFAULT_CONFIG.extractor,
-            ...(loaded.extractor || {}),
-          },
-        };
-      }
+      const content = await readFile(this.configPath, "utf-8");
+      const loaded = JSON.parse(content);
+      this.config = {
+        ...DEFAULT_CONFIG,
+        ...loaded,
+        crawler: { ...DEFAULT_CONFIG.crawler, ...(loaded.crawler || {}) },
+        extractor: {
+          ...DEFAULT_CONFIG.extractor,
+          ...(loaded.extractor || {}),
+        },
+      };
     } catch {
-      // Use defaults if can't load
+      // Use defaults if missing or can't load
     }
     return this.config;
   }
@@ -73,10 +70,7 @@ export class ConfigManager {
       extractor: { ...this.config.extractor, ...(config.extractor || {}) },
     };
 
-    const dir = dirname(this.configPath);
-    if (!existsSync(dir)) {
-      await mkdir(dir, { recursive: true });
-    }
+    await mkdir(dirname(this.configPath), { recursive: true });
 
     await writeFile(
       this.configPath,
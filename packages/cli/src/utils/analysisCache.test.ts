@@ -0,0 +1,112 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from "vitest";
+import { mkdtemp, rm, writeFile } from "fs/promises";
+import { tmpdir } from "os";
+import { join } from "path";
+
+vi.mock("@site-generator/analyzer", () => ({ ANALYZER_VERSION: "1.0.0" }));
+
+import {
+  getAnalysisCacheDir,
+  generateAnalysisCacheKey,
+  readCachedAnalysis,
+  writeCachedAnalysis,
+} from "./analysisCache";
+
+describe("analysisCache", () => {
+  const page = {
+    url: "https://example.com/about",
+    title: "About",
+    markdown: "# About us",
+  };
+
+  describe("generateAnalysisCacheKey", () => {
+    it("should produce a stable key for the same page", () => {
+      const key = generateAnalysisCacheKey(page);
+
+      expect(key).toMatch(/^[0-9a-f]{32}$/);
+      expect(generateAnalysisCacheKey({ ...page })).toBe(key);
+    });
+
+    it("should change when url, title or markdown change", () => {
+      const key = generateAnalysisCacheKey(page);
+
+      expect(
+        generateAnalysisCacheKey({ ...page, url: "https://example.com/" }),
+      ).not.toBe(key);
+      expect(generateAnalysisCacheKey({ ...page, title: "Team" })).not.toBe(
+        key,
+      );
+      expect(
+        generateAnalysisCacheKey({ ...page, markdown: "# About them" }),
+      ).not.toBe(key);
+    });
+
+    it("should not confuse fields that concatenate to the same text", () => {
+      const first = { url: "a", title: "bc", markdown: "" };
+      const second = { url: "ab", title: "c", markdown: "" };
+
+      expect(generateAnalysisCacheKey(first)).not.toBe(
+        generateAnalysisCacheKey(second),
+      );
+    });
+
+    it("should change with the analyzer version", async () => {
+      const key = generateAnalysisCacheKey(page);
+
+      vi.resetModules();
+      vi.doMock("@site-generator/analyzer", () => ({
+        ANALYZER_VERSION: "2.0.0",
+      }));
+      const upgraded = await import("./analysisCache");
+
+      expect(upgraded.generateAnalysisCacheKey(page)).not.toBe(key);
+      vi.doUnmock("@site-generator/analyzer");
+    });
+  });
+
+  describe("cache entries", () => {
+    let outputDir: string;
+    let cacheDir: string;
+
+    beforeEach(async () => {
+      outputDir = await mkdtemp(join(tmpdir(), "site-generator-cache-"));
+      cacheDir = getAnalysisCacheDir(outputDir);
+    });
+
+    afterEach(async () => {
+      await rm(outputDir, { recursive: true, force: true });
+    });
+
+    it("should keep the cache inside the output directory", () => {
+      expect(cacheDir).toBe(join(outputDir, ".cache"));
+    });
+
+    it("should round-trip a written result", async () => {
+      const result = { url: page.url, pageType: "about", confidence: 0.9 };
+
+      await writeCachedAnalysis(cacheDir, "key", result);
+
+      expect(await readCachedAnalysis(cacheDir, "key")).toEqual(result);
+    });
+
+    it("should treat missing entries as misses", async () => {
+      expect(await readCachedAnalysis(cacheDir, "missing")).toBeUndefined();
+    });
+
+    it("should treat corrupt entries as misses", async () => {
+      await writeCachedAnalysis(cacheDir, "key", { pageType: "about" });
+      await writeFile(join(cacheDir, "key.json"), "{not json", "utf-8");
+
+      expect(await readCachedAnalysis(cacheDir, "key")).toBeUndefined();
+    });
+
+    it("should reject when the cache directory cannot be created", async () => {
+      const blocked = join(outputDir, "file");
+      await writeFile(blocked, "", "utf-8");
+
+      await expect(
+        writeCachedAnalysis(join(blocked, ".cache"), "key", {}),
+      ).rejects.toThrow();
+    });
+  });
+});
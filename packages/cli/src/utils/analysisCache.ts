@@ -0,0 +1,55 @@
+import { readFile, writeFile, mkdir } from "fs/promises";
+import { join } from "path";
+import { createHash } from "crypto";
+import { ANALYZER_VERSION } from "@site-generator/analyzer";
+
+export interface AnalysisCacheInput {
+  url: string;
+  title: string;
+  markdown: string;
+}
+
+export function getAnalysisCacheDir(outputDir: string): string {
+  return join(outputDir, ".cache");
+}
+
+export function generateAnalysisCacheKey(page: AnalysisCacheInput): string {
+  return createHash("sha256")
+    // Results change shape with the analyzer, so upgrading it invalidates
+    // every entry
+    .update(ANALYZER_VERSION)
+    .update("\0")
+    .update(page.url)
+    .update("\0")
+    .update(page.title)
+    .update("\0")
+    .update(page.markdown)
+    .digest("hex")
+    .substring(0, 32);
+}
+
+export async function readCachedAnalysis(
+  cacheDir: string,
+  key: string,
+): Promise<any | undefined> {
+  try {
+    const content = await readFile(join(cacheDir, `${key}.json`), "utf-8");
+    return JSON.parse(content);
+  } catch {
+    // Missing or unreadable entries are treated as cache misses
+    return undefined;
+  }
+}
+
+export async function writeCachedAnalysis(
+  cacheDir: string,
+  key: string,
+  result: any,
+): Promise<void> {
+  await mkdir(cacheDir, { recursive: true });
+  await writeFile(
+    join(cacheDir, `${key}.json`),
+    JSON.stringify(result),
+    "utf-8",
+  );
+}
@@ -0,0 +1,268 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from "vitest";
+import { mkdtemp, rm, writeFile } from "fs/promises";
+import { tmpdir } from "os";
+import { join } from "path";
+
+vi.mock("@site-generator/analyzer", () => ({ ANALYZER_VERSION: "1.0.0" }));
+
+import type { ExtractedPage } from "@site-generator/analyzer";
+import {
+  mapWithConcurrency,
+  prepareAnalysisFile,
+  analyzePendingFiles,
+  cacheAnalysisResults,
+} from "./analysisRunner";
+import type { PreparedFile } from "./analysisRunner";
+import {
+  getAnalysisCacheDir,
+  generateAnalysisCacheKey,
+  readCachedAnalysis,
+  writeCachedAnalysis,
+} from "./analysisCache";
+import type { ExtractedFile } from "./fileReader";
+
+function createFile(filename: string, content: string): ExtractedFile {
+  return {
+    path: `/extracted/example_com/${filename}`,
+    filename,
+    content,
+    format: filename.endsWith(".json") ? "json" : "markdown",
+    domain: "example_com",
+    timestamp: "2025-10-06T12-30-45",
+  };
+}
+
+function createPending(filename: string, url: string): PreparedFile {
+  return {
+    file: createFile(filename, "# Page"),
+    page: { url, title: filename, markdown: "# Page", frontmatter: {} },
+    cacheKey: filename,
+  };
+}
+
+// Analyze each page to a result naming it, failing the URLs given
+function createAnalyzer(failingUrls: string[] = []) {
+  return {
+    analyzeContent: vi.fn(async (pages: ExtractedPage[]) =>
+      pages
+        .filter((page) => !failingUrls.includes(page.url))
+        .map((page) => ({ url: page.url, analyzed: page.title })),
+    ),
+  };
+}
+
+describe("analysisRunner", () => {
+  let outputDir: string;
+  let cacheDir: string;
+
+  beforeEach(async () => {
+    outputDir = await mkdtemp(join(tmpdir(), "site-generator-runner-"));
+    cacheDir = getAnalysisCacheDir(outputDir);
+  });
+
+  afterEach(async () => {
+    await rm(outputDir, { recursive: true, force: true });
+  });
+
+  describe("mapWithConcurrency", () => {
+    it("should keep input order with bounded concurrency", async () => {
+      let active = 0;
+      let maxActive = 0;
+
+      const results = await mapWithConcurrency(
+        [30, 10, 20, 0],
+        2,
+        async (n) => {
+          active++;
+          maxActive = Math.max(maxActive, active);
+          await new Promise((resolve) => setTimeout(resolve, n));
+          active--;
+          return n * 2;
+        },
+      );
+
+      expect(results).toEqual([60, 20, 40, 0]);
+      expect(maxActive).toBe(2);
+    });
+  });
+
+  describe("prepareAnalysisFile", () => {
+    it("should build the page from extracted JSON", async () => {
+      const file = createFile(
+        "page.json",
+        JSON.stringify({
+          content: {
+            url: "https://example.com/page",
+            markdown: "# Page",
+            metadata: { title: "Page" },
+          },
+        }),
+      );
+
+      const prepared = await prepareAnalysisFile(file, cacheDir, false);
+
+      expect(prepared.page.url).toBe("https://example.com/page");
+      expect(prepared.page.title).toBe("Page");
+      expect(prepared.page.markdown).toBe("# Page");
+      expect(prepared.cacheKey).toBe(generateAnalysisCacheKey(prepared.page));
+      expect(prepared.result).toBeUndefined();
+    });
+
+    it("should reuse a cached result for an unchanged page", async () => {
+      const file = createFile("page.md", "# Page");
+      const { cacheKey } = await prepareAnalysisFile(file, cacheDir, false);
+      await writeCachedAnalysis(cacheDir, cacheKey, { pageType: "home" });
+
+      const prepared = await prepareAnalysisFile(file, cacheDir, false);
+
+      expect(prepared.result).toEqual({ pageType: "home" });
+    });
+
+    it("should ignore the cache when forced", async () => {
+      const file = createFile("page.md", "# Page");
+      const { cacheKey } = await prepareAnalysisFile(file, cacheDir, false);
+      await writeCachedAnalysis(cacheDir, cacheKey, { pageType: "home" });
+
+      const prepared = await prepareAnalysisFile(file, cacheDir, true);
+
+      expect(prepared.result).toBeUndefined();
+    });
+  });
+
+  describe("analyzePendingFiles", () => {
+    it("should analyze all pending files in one batch", async () => {
+      const analyzer = createAnalyzer();
+      const pending = [
+        createPending("a.md", "https://example.com/a"),
+        createPending("b.md", "https://example.com/b"),
+      ];
+
+      const failures = await analyzePendingFiles(analyzer, pending, 2);
+
+      expect(failures).toEqual([]);
+      expect(analyzer.analyzeContent).toHaveBeenCalledTimes(1);
+      expect(pending.map((item) => item.result?.analyzed)).toEqual([
+        "a.md",
+        "b.md",
+      ]);
+    });
+
+    it("should retry files the batch missed one at a time", async () => {
+      const analyzer = createAnalyzer();
+      analyzer.analyzeContent.mockImplementationOnce(async (pages) => [
+        { url: pages[1].url, analyzed: pages[1].title },
+      ]);
+      const pending = [
+        createPending("a.md", "https://example.com/a"),
+        createPending("b.md", "https://example.com/b"),
+      ];
+
+      const failures = await analyzePendingFiles(analyzer, pending, 2);
+
+      expect(failures).toEqual([]);
+      expect(analyzer.analyzeContent).toHaveBeenCalledTimes(2);
+      expect(analyzer.analyzeContent).toHaveBeenLastCalledWith([
+        pending[0].page,
+      ]);
+      expect(pending.map((item) => item.result?.analyzed)).toEqual([
+        "a.md",
+        "b.md",
+      ]);
+    });
+
+    it("should retry every file when the batch throws", async () => {
+      const analyzer = createAnalyzer();
+      analyzer.analyzeContent.mockRejectedValueOnce(new Error("pool down"));
+      const pending = [
+        createPending("a.md", "https://example.com/a"),
+        createPending("b.md", "https://example.com/b"),
+      ];
+
+      const failures = await analyzePendingFiles(analyzer, pending, 2);
+
+      expect(failures).toEqual([]);
+      expect(analyzer.analyzeContent).toHaveBeenCalledTimes(3);
+      expect(pending.map((item) => item.result?.analyzed)).toEqual([
+        "a.md",
+        "b.md",
+      ]);
+    });
+
+    it("should not swap results between files sharing a URL", async () => {
+      const url = "https://example.com/page";
+      const pending = [
+        createPending("old.json", url),
+        createPending("new.json", url),
+      ];
+      // The batch drops the first file; retried alone, it fails again
+      const analyzer = {
+        analyzeContent: vi.fn(async (pages: ExtractedPage[]) =>
+          pages
+            .filter((page) => page.title !== "old.json")
+            .map((page) => ({ url, analyzed: page.title })),
+        ),
+      };
+
+      const failures = await analyzePendingFiles(analyzer, pending, 2);
+
+      expect(pending[0].result).toBeUndefined();
+      expect(pending[1].result?.analyzed).toBe("new.json");
+      expect(failures.map((failure) => failure.filename)).toEqual(["old.json"]);
+    });
+
+    it("should report files that fail on their own", async () => {
+      const analyzer = createAnalyzer(["https://example.com/b"]);
+      const pending = [
+        createPending("a.md", "https://example.com/a"),
+        createPending("b.md", "https://example.com/b"),
+      ];
+
+      const failures = await analyzePendingFiles(analyzer, pending, 2);
+
+      expect(pending[0].result?.analyzed).toBe("a.md");
+      expect(pending[1].result).toBeUndefined();
+      expect(failures).toHaveLength(1);
+      expect(failures[0].filename).toBe("b.md");
+      expect(failures[0].error).toBeInstanceOf(Error);
+    });
+  });
+
+  describe("cacheAnalysisResults", () => {
+    it("should cache results without cross-page fields", async () => {
+      const item = createPending("a.md", "https://example.com/a");
+      item.result = {
+        url: item.page.url,
+        pageType: "home",
+        crossReferences: [{ targetUrl: "https://example.com/b" }],
+        relatedPages: ["https://example.com/b"],
+      };
+
+      await cacheAnalysisResults([item], cacheDir, 2);
+
+      expect(await readCachedAnalysis(cacheDir, item.cacheKey)).toEqual({
+        url: item.page.url,
+        pageType: "home",
+      });
+      expect(item.result.relatedPages).toEqual(["https://example.com/b"]);
+    });
+
+    it("should skip files without a result", async () => {
+      const item = createPending("a.md", "https://example.com/a");
+
+      await cacheAnalysisResults([item], cacheDir, 2);
+
+      expect(await readCachedAnalysis(cacheDir, item.cacheKey)).toBeUndefined();
+    });
+
+    it("should ignore cache write failures", async () => {
+      const blocked = join(outputDir, "file");
+      await writeFile(blocked, "", "utf-8");
+      const item = createPending("a.md", "https://example.com/a");
+      item.result = { pageType: "home" };
+
+      await expect(
+        cacheAnalysisResults([item], join(blocked, ".cache"), 2),
+      ).resolves.toBeUndefined();
+    });
+  });
+});
@@ -0,0 +1,227 @@
+import type {
+  AnalysisOrchestrator,
+  ExtractedPage,
+} from "@site-generator/analyzer";
+import type { ExtractedFile } from "./fileReader.js";
+import {
+  generateAnalysisCacheKey,
+  readCachedAnalysis,
+  writeCachedAnalysis,
+} from "./analysisCache.js";
+import { formatWarning } from "./progress.js";
+
+export interface PreparedFile {
+  file: ExtractedFile;
+  page: ExtractedPage;
+  cacheKey: string;
+  result?: any;
+}
+
+export interface AnalysisFailure {
+  filename: string;
+  error: unknown;
+}
+
+export type PageAnalyzer = Pick<AnalysisOrchestrator, "analyzeContent">;
+
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  concurrency: number,
+  fn: (item: T) => Promise<R>,
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let nextIndex = 0;
+
+  // Each worker pulls the next item until none remain
+  const worker = async (): Promise<void> => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      results[index] = await fn(items[index]);
+    }
+  };
+
+  await Promise.all(
+    Array.from({ length: Math.min(concurrency, items.length) }, () =>
+      worker(),
+    ),
+  );
+
+  return results;
+}
+
+export async function prepareAnalysisFile(
+  file: ExtractedFile,
+  cacheDir: string,
+  force: boolean,
+): Promise<PreparedFile> {
+  // Parse content based on format
+  let contentToAnalyze = file.content;
+  let extractedTitle = file.filename;
+  let extractedUrl = file.path;
+
+  if (file.format === "json") {
+    try {
+      const parsed = JSON.parse(file.content);
+      // Handle different JSON structures
+      if (parsed.content) {
+        contentToAnalyze =
+          parsed.content.markdown ||
+          parsed.content.html ||
+          parsed.content.text ||
+          "";
+        extractedTitle =
+          parsed.content.metadata?.title ||
+          parsed.content.title ||
+          file.filename;
+        extractedUrl = parsed.content.url || file.path;
+      } else {
+        contentToAnalyze =
+          parsed.markdown ||
+          parsed.html ||
+          parsed.text ||
+          JSON.stringify(parsed);
+      }
+    } catch {
+      console.log(
+        formatWarning(
+          `Could not parse JSON in ${file.filename}, using raw content`,
+        ),
+      );
+    }
+  }
+
+  const page: ExtractedPage = {
+    url: extractedUrl,
+    title: extractedTitle,
+    markdown: contentToAnalyze || "",
+    frontmatter: {},
+    metadata: {
+      format: file.format,
+      timestamp: file.timestamp,
+    },
+  };
+
+  const cacheKey = generateAnalysisCacheKey(page);
+  const result = force
+    ? undefined
+    : await readCachedAnalysis(cacheDir, cacheKey);
+
+  return { file, page, cacheKey, result };
+}
+
+/**
+ * Analyze pending files in one batch, retrying anything the batch missed
+ * one file at a time. Results are set on each item; returns the failures.
+ */
+export async function analyzePendingFiles(
+  analyzer: PageAnalyzer,
+  pending: PreparedFile[],
+  concurrency: number,
+  verbose = false,
+): Promise<AnalysisFailure[]> {
+  const failures: AnalysisFailure[] = [];
+
+  // Submit every page in one run so the orchestrator can schedule
+  // them together across its worker pool
+  try {
+    const batchResults = await analyzer.analyzeContent(
+      pending.map((item) => item.page),
+    );
+    assignBatchResults(pending, batchResults);
+  } catch (batchError) {
+    if (verbose) {
+      console.warn("Batch analysis failed, retrying per file:", batchError);
+    }
+  }
+
+  // Fall back to per-file analysis for anything the batch missed
+  await mapWithConcurrency(
+    pending.filter((item) => item.result === undefined),
+    concurrency,
+    async (item) => {
+      try {
+        const results = await analyzer.analyzeContent([item.page]);
+        item.result = results[0];
+        if (!item.result) {
+          throw new Error(
+            `Analysis returned no results for ${item.file.filename}`,
+          );
+        }
+      } catch (analyzeError) {
+        failures.push({ filename: item.file.filename, error: analyzeError });
+      }
+    },
+  );
+
+  return failures;
+}
+
+/**
+ * Persist fresh results for the next run. The cache is only an
+ * optimization, so write failures are ignored.
+ */
+export async function cacheAnalysisResults(
+  items: PreparedFile[],
+  cacheDir: string,
+  concurrency: number,
+  verbose = false,
+): Promise<void> {
+  await mapWithConcurrency(items, concurrency, async (item) => {
+    if (item.result === undefined) return;
+    try {
+      await writeCachedAnalysis(
+        cacheDir,
+        item.cacheKey,
+        withoutCrossPageFields(item.result),
+      );
+    } catch (cacheError) {
+      if (verbose) {
+        console.warn(
+          `Could not cache analysis for ${item.file.filename}:`,
+          cacheError,
+        );
+      }
+    }
+  });
+}
+
+function assignBatchResults(pending: PreparedFile[], results: any[]): void {
+  // The orchestrator drops failed pages from its results, so they can only
+  // be matched back by URL. When files share a URL and the counts differ,
+  // there is no telling which one failed; leave them all to the per-file
+  // fallback rather than hand one file another's analysis
+  const byUrl = new Map<string, any[]>();
+  for (const result of results) {
+    const queue = byUrl.get(result.url);
+    if (queue) {
+      queue.push(result);
+    } else {
+      byUrl.set(result.url, [result]);
+    }
+  }
+
+  const pendingCounts = new Map<string, number>();
+  for (const item of pending) {
+    pendingCounts.set(
+      item.page.url,
+      (pendingCounts.get(item.page.url) ?? 0) + 1,
+    );
+  }
+
+  for (const item of pending) {
+    const queue = byUrl.get(item.page.url);
+    if (queue && queue.length === pendingCounts.get(item.page.url)) {
+      item.result = queue.shift();
+      pendingCounts.set(item.page.url, queue.length);
+    }
+  }
+}
+
+function withoutCrossPageFields(result: any): any {
+  // Cross-references depend on the other pages in a run, so a cached result
+  // keeps only what describes its own page
+  const pageResult = { ...result };
+  delete pageResult.crossReferences;
+  delete pageResult.relatedPages;
+  return pageResult;
+}
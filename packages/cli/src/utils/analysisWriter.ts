@@ -22,51 +22,24 @@ export async function writeAnalysisResults(
   // Ensure output directory exists
   await mkdir(domainDir, { recursive: true });
 
-  const writtenFiles: string[] = [];
-
-  // Write full analysis
-  if (results.full) {
-    const filename = `${domain}_${timestamp}_analysis.json`;
-    const filepath = join(domainDir, filename);
-    await writeFile(filepath, JSON.stringify(results.full, null, 2), "utf-8");
-    writtenFiles.push(filepath);
-  }
-
-  // Write individual analysis components
-  if (results.metrics) {
-    const filename = `${domain}_${timestamp}_metrics.json`;
-    const filepath = join(domainDir, filename);
-    await writeFile(
-      filepath,
-      JSON.stringify(results.metrics, null, 2),
-      "utf-8",
-    );
-    writtenFiles.push(filepath);
-  }
-
-  if (results.classification) {
-    const filename = `${domain}_${timestamp}_classification.json`;
-    const filepath = join(domainDir, filename);
-    await writeFile(
-      filepath,
-      JSON.stringify(results.classification, null, 2),
-      "utf-8",
-    );
-    writtenFiles.push(filepath);
-  }
-
-  if (results.sections) {
-    const filename = `${domain}_${timestamp}_sections.json`;
-    const filepath = join(domainDir, filename);
-    await writeFile(
-      filepath,
-      JSON.stringify(results.sections, null, 2),
-      "utf-8",
-    );
-    writtenFiles.push(filepath);
-  }
-
-  return writtenFiles;
+  // Write the full analysis and each requested component concurrently
+  const components: Array<[string, any]> = [
+    ["analysis", results.full],
+    ["metrics", results.metrics],
+    ["classification", results.classification],
+    ["sections", results.sections],
+  ];
+
+  return Promise.all(
+    components
+      .filter(([, data]) => data)
+      .map(async ([suffix, data]) => {
+        const filename = `${domain}_${timestamp}_${suffix}.json`;
+        const filepath = join(domainDir, filename);
+        await writeFile(filepath, JSON.stringify(data, null, 2), "utf-8");
+        return filepath;
+      }),
+  );
 }
 
 export async function writeSummary(
@@ -0,0 +1,76 @@
+import { describe, it, expect, beforeEach, afterEach } from "vitest";
+import { mkdir, mkdtemp, rm, symlink, writeFile } from "fs/promises";
+import { tmpdir } from "os";
+import { join } from "path";
+import { readExtractedFiles } from "./fileReader";
+
+describe("readExtractedFiles", () => {
+  let inputDir: string;
+
+  beforeEach(async () => {
+    inputDir = await mkdtemp(join(tmpdir(), "site-generator-files-"));
+  });
+
+  afterEach(async () => {
+    await rm(inputDir, { recursive: true, force: true });
+  });
+
+  it("should read content files and skip metadata sidecars", async () => {
+    const domainDir = join(inputDir, "example_com");
+    await mkdir(domainDir);
+    await writeFile(join(domainDir, "page_2025-10-06T12-30-45.md"), "# Page");
+    await writeFile(join(domainDir, "page_2025-10-06T12-30-45.json"), "{}");
+    await writeFile(join(domainDir, "page_metadata.json"), "{}");
+    await writeFile(join(domainDir, "notes.txt"), "ignored");
+
+    const files = await readExtractedFiles(inputDir);
+    const byName = new Map(files.map((file) => [file.filename, file]));
+
+    expect(files).toHaveLength(2);
+    expect(byName.get("page_2025-10-06T12-30-45.md")?.format).toBe(
+      "markdown",
+    );
+    expect(byName.get("page_2025-10-06T12-30-45.md")?.timestamp).toBe(
+      "2025-10-06T12-30-45",
+    );
+    expect(byName.get("page_2025-10-06T12-30-45.json")?.format).toBe("json");
+  });
+
+  it("should not skip domains whose name contains _metadata", async () => {
+    const domainDir = join(inputDir, "my_metadata_com");
+    await mkdir(domainDir);
+    await writeFile(join(domainDir, "my_metadata_com_page.md"), "# Page");
+
+    const files = await readExtractedFiles(inputDir);
+
+    expect(files.map((file) => file.filename)).toEqual([
+      "my_metadata_com_page.md",
+    ]);
+    expect(files[0].domain).toBe("my_metadata_com");
+  });
+
+  it("should skip directories with content-like names", async () => {
+    const domainDir = join(inputDir, "example_com");
+    await mkdir(join(domainDir, "assets.md"), { recursive: true });
+    await writeFile(join(domainDir, "page.md"), "# Page");
+
+    const files = await readExtractedFiles(inputDir);
+
+    expect(files.map((file) => file.filename)).toEqual(["page.md"]);
+  });
+
+  it("should follow symlinks to files", async () => {
+    const domainDir = join(inputDir, "example_com");
+    await mkdir(domainDir);
+    const target = join(inputDir, "shared.md");
+    await writeFile(target, "# Shared");
+    await symlink(target, join(domainDir, "linked.md"));
+    await symlink(join(inputDir, "missing.md"), join(domainDir, "dangling.md"));
+
+    const files = await readExtractedFiles(inputDir);
+
+    expect(files).toHaveLength(1);
+    expect(files[0].filename).toBe("linked.md");
+    expect(files[0].content).toBe("# Shared");
+  });
+});
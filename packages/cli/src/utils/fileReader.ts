@@ -1,5 +1,6 @@
+import type { Dirent } from "fs";
 import { readdir, readFile, stat } from "fs/promises";
-import { join, extname, basename } from "path";
+import { join } from "path";
 
 export interface ExtractedFile {
   path: string;
@@ -22,26 +23,30 @@ export async function readExtractedFiles(
     for (const entry of entries) {
       if (entry.isDirectory()) {
         const domainDir = join(inputDir, entry.name);
-        const domainFiles = await readdir(domainDir);
+        const domainEntries = await readdir(domainDir, {
+          withFileTypes: true,
+        });
 
-        for (const filename of domainFiles) {
+        for (const fileEntry of domainEntries) {
           // Skip metadata files and non-content files
-          if (
-            filename.includes("_metadata") ||
-            (!filename.endsWith(".md") && !filename.endsWith(".json"))
-          ) {
+          const filename = fileEntry.name;
+          const format = getContentFormat(filename);
+          if (!format) {
             continue;
           }
 
           const filepath = join(domainDir, filename);
+          if (!(await isReadableFile(fileEntry, filepath))) {
+            continue;
+          }
+
           const content = await readFile(filepath, "utf-8");
-          const ext = extname(filename);
 
           files.push({
             path: filepath,
             filename,
             content,
-            format: ext === ".md" ? "markdown" : "json",
+            format,
             domain: entry.name,
             timestamp: extractTimestamp(filename),
           });
@@ -55,6 +60,38 @@ export async function readExtractedFiles(
   }
 }
 
+// Checked in order, so sidecar suffixes must precede their extension
+const FILE_SUFFIXES: Array<[string, ExtractedFile["format"] | null]> = [
+  ["_metadata.json", null],
+  [".md", "markdown"],
+  [".json", "json"],
+];
+
+function getContentFormat(filename: string): ExtractedFile["format"] | null {
+  for (const [suffix, format] of FILE_SUFFIXES) {
+    if (filename.endsWith(suffix)) {
+      return format;
+    }
+  }
+  return null;
+}
+
+async function isReadableFile(entry: Dirent, path: string): Promise<boolean> {
+  if (entry.isFile()) {
+    return true;
+  }
+  if (!entry.isSymbolicLink()) {
+    return false;
+  }
+
+  // Follow symlinks to their target, skipping dangling links and directories
+  try {
+    return (await stat(path)).isFile();
+  } catch {
+    return false;
+  }
+}
+
 function extractTimestamp(filename: string): string {
   // Extract timestamp from filename like: example_com_2025-10-06T12-30-45.md
   const match = filename.match(/(\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2})/);
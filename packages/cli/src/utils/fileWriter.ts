@@ -1,6 +1,5 @@
 import { mkdir, writeFile } from "fs/promises";
 import { join } from "path";
-import { existsSync } from "fs";
 
 export interface WriteFileOptions {
   outputDir: string;
@@ -14,8 +13,8 @@ export async function writeOutputFile(
 ): Promise<string> {
   const { outputDir, filename, content, createDir = true } = options;
 
-  // Ensure output directory exists
-  if (createDir && !existsSync(outputDir)) {
+  // Ensure output directory exists (recursive mkdir is a no-op if present)
+  if (createDir) {
     await mkdir(outputDir, { recursive: true });
   }
 
@@ -2,3 +2,5 @@ export * from "./fileWriter.js";
 export * from "./progress.js";
 export * from "./fileReader.js";
 export * from "./analysisWriter.js";
+export * from "./analysisCache.js";
+export * from "./analysisRunner.js";
@@ -5,13 +5,15 @@ export interface RobotCheck {
 }
 
 interface RobotRules {
-  disallow: string[];
-  allow: string[];
+  // Patterns are compiled once when robots.txt is parsed, not per check
+  disallow: RegExp[];
+  allow: RegExp[];
   sitemaps: string[];
 }
 
 export class RobotsTxtChecker {
-  private cache: Map<string, RobotRules> = new Map();
+  // Shared per domain so concurrent checks wait on a single fetch
+  private cache: Map<string, Promise<RobotRules>> = new Map();
 
   async checkUrl(
     url: string,
@@ -22,20 +24,22 @@ export class RobotsTxtChecker {
       const domain = `${urlObj.protocol}//${urlObj.hostname}`;
 
       // Get or fetch rules
-      let rules = this.cache.get(domain);
-      if (!rules) {
-        rules = await this.fetchRobotsTxt(domain, userAgent);
-        this.cache.set(domain, rules);
+      let pending = this.cache.get(domain);
+      if (!pending) {
+        const fetching = this.fetchRobotsTxt(domain, userAgent);
+        this.cache.set(domain, fetching);
+        // Don't remember network or server failures; retry on the next check
+        fetching.catch(() => {
+          if (this.cache.get(domain) === fetching) this.cache.delete(domain);
+        });
+        pending = fetching;
       }
+      const rules = await pending;
 
       // Check if URL is disallowed
       const path = urlObj.pathname;
-      const isDisallowed = rules.disallow.some((pattern) =>
-        this.matchesPattern(path, pattern),
-      );
-      const isAllowed = rules.allow.some((pattern) =>
-        this.matchesPattern(path, pattern),
-      );
+      const isDisallowed = rules.disallow.some((pattern) => pattern.test(path));
+      const isAllowed = rules.allow.some((pattern) => pattern.test(path));
 
       // Allow takes precedence over disallow
       if (isAllowed) {
@@ -64,21 +68,28 @@ export class RobotsTxtChecker {
     const robotsUrl = `${domain}/robots.txt`;
     const rules: RobotRules = { disallow: [], allow: [], sitemaps: [] };
 
-    try {
-      const response = await fetch(robotsUrl, {
-        signal: AbortSignal.timeout(5000),
-      });
-
-      if (!response.ok) {
-        return rules; // No robots.txt, allow all
+    const response = await fetch(robotsUrl, {
+      signal: AbortSignal.timeout(5000),
+    });
+
+    if (!response.ok) {
+      // Release the connection back to the keep-alive pool
+      await response.body?.cancel();
+      // Any 4xx means robots.txt is unavailable, so allow all (RFC 9309);
+      // only 429 and 5xx are transient and worth retrying
+      if (
+        response.status >= 400 &&
+        response.status < 500 &&
+        response.status !== 429
+      ) {
+        return rules;
       }
-
-      const content = await response.text();
-      this.parseRobotsTxt(content, userAgent, rules);
-    } catch {
-      // Error fetching, allow all
+      throw new Error(`Failed to fetch ${robotsUrl}: HTTP ${response.status}`);
     }
 
+    const content = await response.text();
+    this.parseRobotsTxt(content, userAgent, rules);
+
     return rules;
   }
 
@@ -98,11 +109,11 @@ export class RobotsTxtChecker {
         relevantSection = agent === "*" || agent === userAgent.toLowerCase();
       } else if (relevantSection) {
         if (trimmed.startsWith("disallow:")) {
-          const path = line.split(":").slice(1).join(":").trim();
-          if (path) rules.disallow.push(path);
+          const pattern = this.compilePattern(line);
+          if (pattern) rules.disallow.push(pattern);
         } else if (trimmed.startsWith("allow:")) {
-          const path = line.split(":").slice(1).join(":").trim();
-          if (path) rules.allow.push(path);
+          const pattern = this.compilePattern(line);
+          if (pattern) rules.allow.push(pattern);
         }
       }
 
@@ -114,9 +125,17 @@ export class RobotsTxtChecker {
     }
   }
 
-  private matchesPattern(path: string, pattern: string): boolean {
+  private compilePattern(line: string): RegExp | null {
+    const path = line.split(":").slice(1).join(":").trim();
+    if (!path) return null;
+
     // Convert robots.txt pattern to regex
-    const regexPattern = pattern.replace(/\*/g, ".*").replace(/\?/g, ".");
-    return new RegExp(`^${regexPattern}`).test(path);
+    const regexPattern = path.replace(/\*/g, ".*").replace(/\?/g, ".");
+    try {
+      return new RegExp(`^${regexPattern}`);
+    } catch {
+      // Skip rules that don't form a valid pattern
+      return null;
+    }
   }
 }
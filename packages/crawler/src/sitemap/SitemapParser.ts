@@ -17,6 +17,8 @@ export class SitemapParser {
       });
 
       if (!response.ok) {
+        // Release the connection back to the keep-alive pool
+        await response.body?.cancel();
         return [];
       }
 
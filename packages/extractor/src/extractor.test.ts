@@ -18,6 +18,7 @@ import { MarkdownConverter } from "./markdown-converter";
 import { MediaExtractor } from "./media-extractor";
 import { UrlNormalizer } from "./url-normalizer";
 import { ContentFilter } from "./content-filter";
+import { checkRobotsTxt, clearRobotsTxtCache } from "./utils/robotsTxt";
 
 describe("ContentExtractor", () => {
   let extractor: ContentExtractor;
@@ -266,6 +267,19 @@ describe("ContentExtractor", () => {
       expect(media.some((m) => m.type === "document")).toBe(true);
     });
 
+    it("should deduplicate images by URL", () => {
+      const images = mediaExtractor.extractImages(`
+        <img src="https://example.com/logo.png" alt="Logo">
+        <img src="https://example.com/photo.jpg" alt="Photo">
+        <img src="https://example.com/logo.png" alt="Footer logo">
+      `);
+
+      expect(images).toHaveLength(2);
+      expect(images[0].url).toContain("example.com/logo.png");
+      expect(images[0].alt).toBe("Logo");
+      expect(images[1].url).toContain("example.com/photo.jpg");
+    });
+
     it("should resolve relative URLs", () => {
       const images = mediaExtractor.extractImages(
         '<img src="/relative/path.jpg">',
@@ -488,4 +502,76 @@ describe("ContentExtractor", () => {
       expect(result.content).toBeDefined();
     });
   });
+
+  describe("checkRobotsTxt", () => {
+    const robotsTxt = "User-agent: *\nDisallow: /private\n";
+
+    beforeEach(() => {
+      clearRobotsTxtCache();
+    });
+
+    afterEach(() => {
+      vi.unstubAllGlobals();
+    });
+
+    it("should fetch robots.txt once per site", async () => {
+      const fetchMock = vi.fn(async () => new Response(robotsTxt));
+      vi.stubGlobal("fetch", fetchMock);
+
+      const blocked = await checkRobotsTxt("https://example.com/private/a");
+      const allowed = await checkRobotsTxt("https://example.com/public");
+
+      expect(blocked.allowed).toBe(false);
+      expect(allowed.allowed).toBe(true);
+      expect(fetchMock).toHaveBeenCalledTimes(1);
+    });
+
+    it("should not cache transient server errors", async () => {
+      const fetchMock = vi
+        .fn()
+        .mockResolvedValueOnce(new Response("", { status: 503 }))
+        .mockResolvedValueOnce(new Response(robotsTxt));
+      vi.stubGlobal("fetch", fetchMock);
+
+      const first = await checkRobotsTxt("https://example.com/private/a");
+      const second = await checkRobotsTxt("https://example.com/private/a");
+
+      expect(first.allowed).toBe(true);
+      expect(second.allowed).toBe(false);
+      expect(fetchMock).toHaveBeenCalledTimes(2);
+    });
+
+    it("should skip rules that are not valid patterns", async () => {
+      const content = "User-agent: *\nDisallow: /a(b\nDisallow: /private\n";
+      vi.stubGlobal("fetch", vi.fn(async () => new Response(content)));
+
+      const invalid = await checkRobotsTxt("https://example.com/a(b");
+      const blocked = await checkRobotsTxt("https://example.com/private/a");
+
+      expect(invalid.allowed).toBe(true);
+      expect(blocked.allowed).toBe(false);
+    });
+
+    it("should cache a missing robots.txt as allow-all", async () => {
+      const fetchMock = vi.fn(async () => new Response("", { status: 404 }));
+      vi.stubGlobal("fetch", fetchMock);
+
+      await checkRobotsTxt("https://example.com/a");
+      const result = await checkRobotsTxt("https://example.com/b");
+
+      expect(result.allowed).toBe(true);
+      expect(fetchMock).toHaveBeenCalledTimes(1);
+    });
+
+    it("should cache a forbidden robots.txt as allow-all", async () => {
+      const fetchMock = vi.fn(async () => new Response("", { status: 403 }));
+      vi.stubGlobal("fetch", fetchMock);
+
+      await checkRobotsTxt("https://example.com/a");
+      const result = await checkRobotsTxt("https://example.com/b");
+
+      expect(result.allowed).toBe(true);
+      expect(fetchMock).toHaveBeenCalledTimes(1);
+    });
+  });
 });
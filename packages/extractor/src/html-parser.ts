@@ -72,6 +72,8 @@ export class HtmlParser {
       });
 
       if (!response.ok) {
+        // Release the connection back to the keep-alive pool
+        await response.body?.cancel();
         return {
           success: false,
           error: `HTTP ${response.status}: ${response.statusText}`,
@@ -83,6 +85,7 @@ export class HtmlParser {
         !contentType.includes("text/html") &&
         !contentType.includes("application/xhtml")
       ) {
+        await response.body?.cancel();
         return {
           success: false,
           error: `Invalid content type: ${contentType}`,
@@ -10,4 +10,4 @@ export * from "./content-filter.js";
 export { BrowserManager } from "./browser/index.js";
 export { PlaywrightRenderer } from "./renderers/index.js";
 export type { RenderResult } from "./renderers/index.js";
-export { checkRobotsTxt } from "./utils/index.js";
+export { checkRobotsTxt, clearRobotsTxtCache } from "./utils/index.js";
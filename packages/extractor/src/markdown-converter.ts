@@ -159,22 +159,22 @@ export class MarkdownConverter {
 
         if (rows.length === 0) return "";
 
-        // Build markdown table
-        let markdown = "\n";
+        // Build markdown table line by line and join once
         const colCount = Math.max(...rows.map((r) => r.length));
+        const lines: string[] = [];
 
         // Add header row
-        markdown += "| " + (rows[0] || []).join(" | ") + " |\n";
+        lines.push("| " + (rows[0] || []).join(" | ") + " |");
 
         // Add separator
-        markdown += "| " + Array(colCount).fill("---").join(" | ") + " |\n";
+        lines.push("| " + Array(colCount).fill("---").join(" | ") + " |");
 
         // Add data rows
         for (let i = 1; i < rows.length; i++) {
-          markdown += "| " + (rows[i] || []).join(" | ") + " |\n";
+          lines.push("| " + (rows[i] || []).join(" | ") + " |");
         }
 
-        return markdown + "\n";
+        return "\n" + lines.join("\n") + "\n\n";
       },
     });
 
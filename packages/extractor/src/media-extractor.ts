@@ -18,7 +18,11 @@ export class MediaExtractor {
     html: string,
   ): Array<{ url: string; alt: string; title?: string }> {
     const $ = cheerio.load(html);
-    const images: Array<{ url: string; alt: string; title?: string }> = [];
+    // Keyed by resolved URL so repeated images (logos, icons) appear once
+    const images = new Map<
+      string,
+      { url: string; alt: string; title?: string }
+    >();
 
     $("img").each((_, imgElement) => {
       const src = $(imgElement).attr("src");
@@ -28,18 +32,20 @@ export class MediaExtractor {
       if (src) {
         try {
           const absoluteUrl = this.resolveUrl(src);
-          images.push({
-            url: absoluteUrl,
-            alt,
-            ...(title && { title }),
-          });
+          if (!images.has(absoluteUrl)) {
+            images.set(absoluteUrl, {
+              url: absoluteUrl,
+              alt,
+              ...(title && { title }),
+            });
+          }
         } catch (error) {
           logger.warn(`Invalid image URL: ${src}`, { src });
         }
       }
     });
 
-    return images;
+    return Array.from(images.values());
   }
 
   /**
@@ -164,6 +170,8 @@ export class MediaExtractor {
       const response = await fetch(url);
 
       if (!response.ok) {
+        // Release the connection back to the keep-alive pool
+        await response.body?.cancel();
         logger.warn(`Failed to download media: ${response.status}`, { url });
         return false;
       }
@@ -1 +1 @@
-export { checkRobotsTxt } from "./robotsTxt.js";
+export { checkRobotsTxt, clearRobotsTxtCache } from "./robotsTxt.js";
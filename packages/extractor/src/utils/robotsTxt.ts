@@ -1,25 +1,40 @@
+interface RobotsRules {
+  // Patterns are compiled once when robots.txt is parsed, not per check
+  disallow: RegExp[];
+  allow: RegExp[];
+}
+
+interface CachedRules {
+  expiresAt: number;
+  rules: Promise<RobotsRules | null>;
+}
+
+const RULES_CACHE_TTL = 60 * 60 * 1000; // 1 hour
+const RULES_CACHE_MAX_ENTRIES = 1000;
+
+// Parsed rules per robots.txt URL and user agent, so repeated extractions
+// from one site fetch robots.txt once; in-flight fetches are shared too
+const rulesCache = new Map<string, CachedRules>();
+
+export function clearRobotsTxtCache(): void {
+  rulesCache.clear();
+}
+
 export async function checkRobotsTxt(
   url: string,
   userAgent = "site-generator-bot",
 ): Promise<{ allowed: boolean; reason?: string }> {
   try {
     const robotsUrl = new URL("/robots.txt", url).href;
-    const response = await fetch(robotsUrl, {
-      signal: AbortSignal.timeout(5000),
-    });
+    const rules = await loadRobotsRules(robotsUrl, userAgent);
 
-    if (!response.ok) {
+    if (!rules) {
       // No robots.txt or error fetching it - allow by default
       return { allowed: true };
     }
 
-    const content = await response.text();
-    const rules = parseRobotsTxt(content, userAgent);
-
     const urlPath = new URL(url).pathname;
-    const isDisallowed = rules.disallow.some((pattern) =>
-      matchesPattern(urlPath, pattern),
-    );
+    const isDisallowed = rules.disallow.some((pattern) => pattern.test(urlPath));
 
     if (isDisallowed) {
       return {
@@ -35,10 +50,68 @@ export async function checkRobotsTxt(
   }
 }
 
-function parseRobotsTxt(content: string, userAgent: string) {
+function loadRobotsRules(
+  robotsUrl: string,
+  userAgent: string,
+): Promise<RobotsRules | null> {
+  const key = `${userAgent}\n${robotsUrl}`;
+  const cached = rulesCache.get(key);
+
+  if (cached && cached.expiresAt > Date.now()) {
+    return cached.rules;
+  }
+  rulesCache.delete(key);
+
+  // Maps iterate in insertion order, so the first key is the oldest entry
+  if (rulesCache.size >= RULES_CACHE_MAX_ENTRIES) {
+    const oldestKey = rulesCache.keys().next().value;
+    if (oldestKey !== undefined) rulesCache.delete(oldestKey);
+  }
+
+  const entry: CachedRules = {
+    expiresAt: Date.now() + RULES_CACHE_TTL,
+    rules: fetchRobotsRules(robotsUrl, userAgent),
+  };
+  rulesCache.set(key, entry);
+  // Don't remember network or server failures; retry on the next check
+  entry.rules.catch(() => {
+    if (rulesCache.get(key) === entry) rulesCache.delete(key);
+  });
+
+  return entry.rules;
+}
+
+async function fetchRobotsRules(
+  robotsUrl: string,
+  userAgent: string,
+): Promise<RobotsRules | null> {
+  const response = await fetch(robotsUrl, {
+    signal: AbortSignal.timeout(5000),
+  });
+
+  if (!response.ok) {
+    // Release the connection back to the keep-alive pool
+    await response.body?.cancel();
+    // Any 4xx means robots.txt is unavailable, so allow all (RFC 9309);
+    // only 429 and 5xx are transient and worth retrying
+    if (
+      response.status >= 400 &&
+      response.status < 500 &&
+      response.status !== 429
+    ) {
+      return null;
+    }
+    throw new Error(`Failed to fetch ${robotsUrl}: HTTP ${response.status}`);
+  }
+
+  const content = await response.text();
+  return parseRobotsTxt(content, userAgent);
+}
+
+function parseRobotsTxt(content: string, userAgent: string): RobotsRules {
   const lines = content.split("\n");
   let relevantSection = false;
-  const rules = { disallow: [] as string[], allow: [] as string[] };
+  const rules: RobotsRules = { disallow: [], allow: [] };
 
   for (const line of lines) {
     const trimmed = line.trim().toLowerCase();
@@ -48,11 +121,11 @@ function parseRobotsTxt(content: string, userAgent: string) {
       relevantSection = agent === "*" || agent === userAgent.toLowerCase();
     } else if (relevantSection) {
       if (trimmed.startsWith("disallow:")) {
-        const path = trimmed.split(":")[1].trim();
-        if (path) rules.disallow.push(path);
+        const pattern = compilePattern(trimmed);
+        if (pattern) rules.disallow.push(pattern);
       } else if (trimmed.startsWith("allow:")) {
-        const path = trimmed.split(":")[1].trim();
-        if (path) rules.allow.push(path);
+        const pattern = compilePattern(trimmed);
+        if (pattern) rules.allow.push(pattern);
       }
     }
   }
@@ -60,8 +133,16 @@ function parseRobotsTxt(content: string, userAgent: string) {
   return rules;
 }
 
-function matchesPattern(path: string, pattern: string): boolean {
+function compilePattern(line: string): RegExp | null {
+  const path = line.split(":")[1].trim();
+  if (!path) return null;
+
   // Simple wildcard matching
-  const regexPattern = pattern.replace(/\*/g, ".*").replace(/\?/g, ".");
-  return new RegExp(`^${regexPattern}`).test(path);
+  const regexPattern = path.replace(/\*/g, ".*").replace(/\?/g, ".");
+  try {
+    return new RegExp(`^${regexPattern}`);
+  } catch {
+    // Skip rules that don't form a valid pattern
+    return null;
+  }
 }